@@ -23,6 +23,7 @@ Critical dependencies:
 
 Optional dependencies:
     - Neo4j GDS: plugin for advanced metrics (PageRank, Betweenness, Louvain)
+    - orjson: faster decoding of Synesis JSON exports
 
 Usage example:
     synesis-graph neo4j --project ./my_project.synp
@@ -38,16 +39,26 @@ Implementation notes:
 """
 from __future__ import annotations
 
+import atexit
+import hashlib
 import json
 import logging
+import os
+import pickle
 import re
+import string
 import sys
 import tempfile
 import time
+import weakref
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from itertools import zip_longest
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Union
 
 try:
     import click
@@ -70,27 +81,16 @@ SUPPORTED_BACKENDS = (BACKEND_NEO4J, BACKEND_GRAPHQLITE, BACKEND_HTML)
 # ============================================================================
 # EXTERNAL IMPORTS
 # ============================================================================
-try:
-    from synesis import SynesisCompiler
-except ImportError:
-    print("ERRO CRÍTICO: Biblioteca 'synesis' não encontrada.")
-    print("Instale via: pip install synesis")
-    sys.exit(1)
-
 try:
     import tomllib
 except ModuleNotFoundError:
     import tomli as tomllib  # type: ignore
 
 try:
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-    from rich import box
-    RICH_AVAILABLE = True
+    from orjson import loads as _fast_json_loads
 except ImportError:
-    Console = Panel = Table = box = None  # type: ignore
-    RICH_AVAILABLE = False
+    _fast_json_loads = None
+
 
 # ============================================================================
 # LOGGING
@@ -102,6 +102,28 @@ logger.addHandler(_handler)
 logger.setLevel(logging.INFO)
 
 
+def get_synesis_compiler_factory() -> Any:
+    """Loads the Synesis compiler lazily (not needed for --json input or --version)."""
+    try:
+        from synesis import SynesisCompiler
+        return SynesisCompiler
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_rich_components() -> Any:
+    """Loads Rich lazily on first TaskReporter; returns None when not installed."""
+    try:
+        from rich import box
+        from rich.console import Console
+        from rich.panel import Panel
+        from rich.table import Table
+    except ImportError:
+        return None
+    return SimpleNamespace(Console=Console, Panel=Panel, Table=Table, box=box)
+
+
 def get_neo4j_driver_factory() -> Any:
     """Loads Neo4j driver factory lazily to isolate backend dependencies."""
     try:
@@ -122,7 +144,7 @@ def get_graphqlite_connect_factory() -> Any:
 # ============================================================================
 # RESULT TYPES (Pattern: Result Types)
 # ============================================================================
-@dataclass
+@dataclass(slots=True)
 class PipelineError:
     """Base pipeline error with context."""
     message: str
@@ -130,45 +152,45 @@ class PipelineError:
     details: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CompilationError(PipelineError):
     """Error in Synesis project compilation."""
     diagnostics: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionError(PipelineError):
     """Error connecting to database backends."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncError(PipelineError):
     """Error synchronizing with the database."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class DependencyError(PipelineError):
     """Error for missing runtime dependencies."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ChainFieldSpec:
     """Specification of a CHAIN field from the template."""
     field_name: str
     relations: Dict[str, str]  # {type: description}
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeFieldSpec:
     """Specification of a CODE field from the template."""
     field_name: str
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphPayload:
     """Payload prepared for Neo4j synchronization."""
     project_name: str
@@ -187,7 +209,7 @@ class GraphPayload:
     from_source: List[Dict[str, Any]]
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResult:
     """Pipeline result with success or error."""
     success: bool
@@ -198,9 +220,18 @@ class PipelineResult:
 # ============================================================================
 # SANITIZATION (Protection against Cypher Injection)
 # ============================================================================
-_CYPHER_LABEL_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+# Character sets of a safe Cypher identifier: [A-Za-z_][A-Za-z0-9_]*
+_CYPHER_LABEL_FIRST_CHARS = frozenset(string.ascii_letters + "_")
+_CYPHER_LABEL_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+
+# Runs of characters that are neither str.isalnum() nor "_" (\W on str patterns)
+_NON_LABEL_CHARS = re.compile(r"\W+")
 
+# Separators folded to "_" in relation types ("contested-by" -> "CONTESTED_BY")
+_RELATION_TYPE_TRANS = str.maketrans({" ": "_", "-": "_"})
 
+
+@lru_cache(maxsize=1024)
 def sanitize_cypher_label(label: str) -> str:
     """
     Sanitizes string for safe use as label/relationship type in Cypher.
@@ -208,12 +239,13 @@ def sanitize_cypher_label(label: str) -> str:
     Keeps only alphanumeric characters and underscore.
     Ensures it starts with a letter or underscore.
     """
-    sanitized = "".join(c for c in label if c.isalnum() or c == "_")
+    sanitized = _NON_LABEL_CHARS.sub("", label)
     if sanitized and sanitized[0].isdigit():
         sanitized = "_" + sanitized
     return sanitized or "Unknown"
 
 
+@lru_cache(maxsize=256)
 def sanitize_database_name(name: str) -> str:
     """
     Sanitizes string for use as Neo4j database name.
@@ -231,9 +263,14 @@ def sanitize_database_name(name: str) -> str:
     return sanitized.lower() or "synesis"
 
 
+@lru_cache(maxsize=256)
 def validate_cypher_label(label: str) -> bool:
     """Validates if label is safe for direct use in Cypher."""
-    return bool(_CYPHER_LABEL_PATTERN.match(label))
+    return (
+        bool(label)
+        and label[0] in _CYPHER_LABEL_FIRST_CHARS
+        and _CYPHER_LABEL_CHARS.issuperset(label)
+    )
 
 
 # ============================================================================
@@ -248,11 +285,12 @@ class TaskReporter:
     """
 
     def __init__(self, title: str):
-        self.console = Console() if RICH_AVAILABLE else None
+        self.rich = get_rich_components()
+        self.console = self.rich.Console() if self.rich else None
         self.stats: Dict[str, int] = {"errors": 0, "warnings": 0, "successes": 0}
         self.start_time = time.time()
         if self.console:
-            self.console.print(Panel(f"[bold cyan]{title}[/]", border_style="cyan"))
+            self.console.print(self.rich.Panel(f"[bold cyan]{title}[/]", border_style="cyan"))
 
     def info(self, msg: str) -> None:
         if self.console:
@@ -291,7 +329,7 @@ class TaskReporter:
                 logger.error(d)
             return
 
-        table = Table(title="Compilation Diagnostics", box=box.SIMPLE, style="red")
+        table = self.rich.Table(title="Compilation Diagnostics", box=self.rich.box.SIMPLE, style="red")
         table.add_column("Mensagem", style="white")
         for diag in diagnostics:
             table.add_row(str(diag))
@@ -300,11 +338,11 @@ class TaskReporter:
     def print_summary(self) -> None:
         duration = int(time.time() - self.start_time)
         if self.console:
-            table = Table(box=box.ROUNDED, show_header=False)
+            table = self.rich.Table(box=self.rich.box.ROUNDED, show_header=False)
             table.add_row("Tempo Total", f"{duration}s")
             status = "[green]SUCCESS[/]" if self.stats["errors"] == 0 else "[red]FAIL[/]"
             table.add_row("Status", status)
-            self.console.print(Panel(table, title="Summary", border_style="cyan"))
+            self.console.print(self.rich.Panel(table, title="Summary", border_style="cyan"))
         else:
             status = "SUCCESS" if self.stats["errors"] == 0 else "FALHA"
             logger.info(f"Summary: {status} in {duration}s")
@@ -319,9 +357,13 @@ class _StepContext:
         self._status = None
 
     def __enter__(self) -> "_StepContext":
-        if self.reporter.console:
-            self._status = self.reporter.console.status(f"[bold cyan]{self.description}...[/]")
+        console = self.reporter.console
+        if console and console.is_terminal:
+            self._status = console.status(f"[bold cyan]{self.description}...[/]")
             self._status.__enter__()
+        elif console:
+            # Redirected output (CI, pipes): no spinner, just the step line
+            console.print(f"[bold cyan]{self.description}...[/]")
         else:
             logger.info(f"--- {self.description} ---")
         return self
@@ -339,6 +381,10 @@ class _StepContext:
 # ============================================================================
 # TEMPLATE ANALYSIS
 # ============================================================================
+# ONTOLOGY field types that become taxonomy nodes
+_GRAPH_FIELD_TYPES = frozenset({"TOPIC", "ENUMERATED", "ORDERED"})
+
+
 def analyze_template(template_data: Dict[str, Any]) -> tuple[List[str], List[str], List[ChainFieldSpec], List[CodeFieldSpec], Dict[str, List[Dict]], List[str], str]:
     """
     Analyzes Synesis template to identify scalar, relational, CHAIN, CODE and SOURCE fields.
@@ -369,7 +415,7 @@ def analyze_template(template_data: Dict[str, Any]) -> tuple[List[str], List[str
         field_type = spec.get("type", "TEXT")
 
         if scope == "ONTOLOGY":
-            if field_type in ("TOPIC", "ENUMERATED", "ORDERED"):
+            if field_type in _GRAPH_FIELD_TYPES:
                 graph_fields.append(field_name)
                 # Store value mapping for ORDERED/ENUMERATED fields
                 if spec.get("values"):
@@ -406,6 +452,16 @@ def get_taxonomy_labels(graph_fields: List[str]) -> List[str]:
 # ============================================================================
 # COMPILATION AND PREPARATION
 # ============================================================================
+def _load_json_bytes(raw: bytes) -> Any:
+    """Decodes UTF-8 JSON with orjson when installed, stdlib json otherwise."""
+    if _fast_json_loads is not None:
+        try:
+            return _fast_json_loads(raw)
+        except ValueError:
+            pass  # orjson rejects NaN/Infinity literals that stdlib json accepts
+    return json.loads(raw)
+
+
 def load_json_project(
     json_path: Path,
     reporter: TaskReporter
@@ -422,8 +478,7 @@ def load_json_project(
     """
     reporter.info(f"Loading Synesis JSON export: {json_path}")
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            json_data = json.load(f)
+        json_data = _load_json_bytes(json_path.read_bytes())
     except Exception as e:
         return CompilationError(
             message="Failed to read JSON export",
@@ -458,7 +513,8 @@ def load_json_project(
 
 def compile_project(
     project_path: Path,
-    reporter: TaskReporter
+    reporter: TaskReporter,
+    cache_dir: Optional[Path] = None
 ) -> Union[GraphPayload, CompilationError]:
     """
     Compiles Synesis project and transforms into payload for Neo4j.
@@ -466,13 +522,35 @@ def compile_project(
     Args:
         project_path: Path to .synp file
         reporter: Reporter for visual feedback
+        cache_dir: Optional payload cache directory; when set, an unchanged
+            project is loaded from the cache instead of being recompiled
 
     Returns:
         GraphPayload on success, CompilationError on failure.
     """
+    compiler_factory = get_synesis_compiler_factory()
+    if compiler_factory is None:
+        return CompilationError(
+            message="Biblioteca 'synesis' não encontrada",
+            stage="dependency",
+            diagnostics=["Instale via: pip install synesis"],
+        )
+
+    cache_file: Optional[Path] = None
+    if cache_dir is not None:
+        try:
+            cache_file = _project_cache_file(cache_dir, project_path)
+        except OSError as e:
+            reporter.warning(f"Payload cache disabled: {e}")
+        else:
+            cached = _load_cached_payload(cache_file)
+            if cached is not None:
+                reporter.success(f"Project unchanged, payload loaded from cache ({cache_file.stem.split('-', 1)[1][:12]}).")
+                return cached
+
     reporter.info(f"Starting Synesis compiler at: {project_path}")
 
-    compiler = SynesisCompiler(project_path)
+    compiler = compiler_factory(project_path)
     result = compiler.compile()
 
     if not result.success:
@@ -482,16 +560,7 @@ def compile_project(
             diagnostics=[str(d) for d in result.get_diagnostics()]
         )
 
-    # Export to temporary JSON and read back
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, encoding='utf-8') as tmp:
-        tmp_path = Path(tmp.name)
-
-    result.to_json(tmp_path)
-
-    with open(tmp_path, 'r', encoding='utf-8') as f:
-        json_data = json.load(f)
-
-    tmp_path.unlink()  # Remove temporary file
+    json_data = _compilation_to_json_data(result)
 
     corpus_count = len(json_data.get("corpus", []))
     reporter.success(f"Compilation OK. {corpus_count} items processed.")
@@ -509,9 +578,193 @@ def compile_project(
         memo_field_name=memo_field_name,
     )
 
+    if cache_file is not None:
+        _store_cached_payload(cache_file, payload)
+
     return payload
 
 
+def _compilation_to_json_data(result: Any) -> Dict[str, Any]:
+    """
+    Obtains the v3.0 JSON structure of a compilation result in memory.
+
+    Prefers the in-memory builders of the synesis package (no serialization);
+    falls back to the file export only for versions that lack them.
+    """
+    if hasattr(result, "to_json_dict"):
+        return result.to_json_dict()
+
+    try:
+        from synesis.exporters.json_export import build_json_payload
+    except ImportError:
+        build_json_payload = None
+
+    linked_project = getattr(result, "linked_project", None)
+    if build_json_payload is not None and linked_project is not None:
+        args = [linked_project, getattr(result, "template", None), getattr(result, "bibliography", None)]
+        dataset = getattr(result, "dataset", None)
+        if dataset is not None:
+            args.append(dataset)
+        return build_json_payload(*args)
+
+    # Legacy synesis: export to an anonymous in-memory file (Linux) ...
+    if hasattr(os, "memfd_create") and os.path.isdir("/proc/self/fd"):
+        fd = os.memfd_create("synesis-compile", 0)
+        fd_path = Path(f"/proc/self/fd/{fd}")
+        try:
+            result.to_json(fd_path)
+            return _load_json_bytes(fd_path.read_bytes())
+        except OSError:
+            pass  # fall back to a regular temporary file
+        finally:
+            os.close(fd)
+
+    # ... or to temporary JSON on disk, and read back
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, encoding='utf-8') as tmp:
+        tmp_path = Path(tmp.name)
+
+    try:
+        result.to_json(tmp_path)
+        return _load_json_bytes(tmp_path.read_bytes())
+    finally:
+        tmp_path.unlink()  # Remove temporary file
+
+
+# ----------------------------------------------------------------------------
+# PAYLOAD CACHE (opt-in, --cache)
+# ----------------------------------------------------------------------------
+# File directives of a .synp: TEMPLATE "..." and INCLUDE [SHARED] <TYPE> "..."
+_SYNP_INCLUDE_PATTERN = re.compile(
+    r'^[ \t]*(?:TEMPLATE|INCLUDE[ \t]+(SHARED[ \t]+)?(BIBLIOGRAPHY|ANNOTATIONS|ONTOLOGY|DATASET))'
+    r'[ \t]+"([^"]+)"',
+    re.IGNORECASE | re.MULTILINE,
+)
+# Extensions a directory INCLUDE collects (as in synesis.parser.paths)
+_SYNP_INCLUDE_EXTENSIONS = {
+    "BIBLIOGRAPHY": ".bib",
+    "ANNOTATIONS": ".syn",
+    "ONTOLOGY": ".syno",
+    "DATASET": ".toml",
+}
+
+
+def default_cache_dir() -> Path:
+    """Per-user payload cache directory ($XDG_CACHE_HOME/synesis-graph)."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "synesis-graph"
+
+
+def _synesis_version() -> str:
+    """Installed synesis compiler version ("unknown" if not installed as a distribution)."""
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        return version("synesis")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _project_reference_files(
+    base_dir: Path,
+    ref: str,
+    include_type: Optional[str],
+    shared: bool = False
+) -> List[Path]:
+    """
+    Files behind a TEMPLATE (include_type None) or INCLUDE directive: a file,
+    a glob, or the files of a directory with the include type's extension.
+
+    Uses the compiler's own expansion when available, so the key tracks exactly
+    the files a compilation reads.
+    """
+    extension = _SYNP_INCLUDE_EXTENSIONS.get(include_type or "")
+    try:
+        from synesis.parser.paths import expand_include
+    except ImportError:
+        expand_include = None
+    if expand_include is not None:
+        expansion = expand_include(base_dir, ref, extension, shared=shared)
+        return [*expansion.files, *expansion.outside]
+
+    ref_path = base_dir / ref
+    if ref_path.is_file():
+        return [ref_path]
+    if ref_path.is_dir():
+        if extension is None:
+            return []
+        return sorted(p for p in ref_path.rglob(f"*{extension}") if p.is_file())
+    try:
+        return sorted(p for p in base_dir.glob(ref) if p.is_file())
+    except (ValueError, NotImplementedError):
+        return []  # absolute or otherwise unsupported pattern: the compiler reports it
+
+
+def _project_cache_key(project_path: Path) -> str:
+    """
+    Hashes everything a compilation depends on: tool and compiler versions,
+    the .synp contents and every file its TEMPLATE / INCLUDE directives read.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"synesis-graph {__version__}\0synesis {_synesis_version()}\0".encode())
+    project_bytes = project_path.read_bytes()
+    digest.update(project_bytes)
+
+    base_dir = project_path.parent
+    project_text = project_bytes.decode("utf-8", errors="replace")
+    for shared, include_type, ref in _SYNP_INCLUDE_PATTERN.findall(project_text):
+        include_type = include_type.upper() or None
+        digest.update(f"\0{include_type}\0{ref}\0".encode())
+        for path in _project_reference_files(base_dir, ref, include_type, shared=bool(shared)):
+            digest.update(f"{path}\0".encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _project_cache_file(cache_dir: Path, project_path: Path) -> Path:
+    """Cache entry for the project's current state: <project id>-<content key>.pkl."""
+    project_id = hashlib.sha256(str(project_path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{project_id}-{_project_cache_key(project_path)}.pkl"
+
+
+def _prune_cached_payloads(cache_file: Path) -> None:
+    """Removes the project's older entries, keeping only cache_file."""
+    project_id = cache_file.name.split("-", 1)[0]
+    for stale in cache_file.parent.glob(f"{project_id}-*.pkl"):
+        if stale != cache_file:
+            try:
+                stale.unlink(missing_ok=True)
+            except OSError as e:
+                logger.debug(f"Stale payload cache not removed {stale}: {e}")
+
+
+def _load_cached_payload(cache_file: Path) -> Optional[GraphPayload]:
+    """Loads a cached payload; a missing or unreadable entry is a cache miss."""
+    try:
+        with cache_file.open("rb") as fh:
+            return GraphPayload(**pickle.load(fh))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable payload cache {cache_file}: {e}")
+        return None
+
+
+def _store_cached_payload(cache_file: Path, payload: GraphPayload) -> None:
+    """Writes the payload fields atomically (temporary file + rename); failures only skip caching."""
+    state = {f.name: getattr(payload, f.name) for f in fields(GraphPayload)}
+    tmp_path: Optional[Path] = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_file.parent, suffix=".tmp", delete=False) as tmp:
+            tmp_path = Path(tmp.name)
+            pickle.dump(state, tmp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_file)
+        _prune_cached_payloads(cache_file)
+    except (OSError, pickle.PicklingError) as e:
+        logger.debug(f"Payload cache not written to {cache_file}: {e}")
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+
+
 def _build_graph_payload(
     json_data: Dict[str, Any],
     scalar_fields: List[str],
@@ -537,14 +790,17 @@ def _build_graph_payload(
         concept_label = "Concept"  # Fallback
 
     # Build relations map for quick lookup
-    relation_definitions: Dict[str, str] = {}
-    for cf in chain_fields:
-        relation_definitions.update(cf.relations)
+    relation_definitions: Dict[str, str] = {
+        rel: description for cf in chain_fields for rel, description in cf.relations.items()
+    }
 
     # Extract CODE field names for corpus search
-    code_field_names = [cf.field_name for cf in code_fields]
+    code_field_names = tuple(cf.field_name for cf in code_fields)
 
-    concepts = _extract_concepts(ontology, scalar_fields, graph_fields, value_maps)
+    # One timestamp for the whole payload build
+    created_at = int(time.time())
+
+    concepts = _extract_concepts(ontology, scalar_fields, graph_fields, value_maps, created_at)
     sources, items, mentions, chains, from_source = _extract_corpus_data(
         corpus, bibliography, relation_definitions, code_field_names, source_fields, memo_field_name
     )
@@ -567,52 +823,68 @@ def _build_graph_payload(
     )
 
 
-def _index_to_label(value: Any, value_map: List[Dict[str, Any]]) -> str:
-    """Converts numeric index to label using the value mapping."""
-    if isinstance(value, int):
+def _build_index_maps(value_maps: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[Any, str]]:
+    """Builds one {index: label} lookup per field from the template value mappings."""
+    index_maps: Dict[str, Dict[Any, str]] = {}
+    for field_name, value_map in value_maps.items():
+        lookup: Dict[Any, str] = {}
         for entry in value_map:
-            if entry.get("index") == value:
-                return entry.get("label", str(value))
-        return str(value)
-    return str(value)
+            index = entry.get("index")
+            if index is not None and index not in lookup:  # first entry wins
+                lookup[index] = entry.get("label", str(index))
+        index_maps[field_name] = lookup
+    return index_maps
 
 
 def _extract_concepts(
     ontology: Dict[str, Any],
     scalar_fields: List[str],
     graph_fields: List[str],
-    value_maps: Dict[str, List[Dict[str, Any]]]
+    value_maps: Dict[str, List[Dict[str, Any]]],
+    created_at: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
-    """Extracts concepts from ontology with properties and relations."""
+    """Extracts concepts from ontology with properties and relations.
+
+    All concepts share the same ``created`` timestamp (``created_at``,
+    defaulting to the current time).
+    """
+    if created_at is None:
+        created_at = int(time.time())
     concepts = []
+    index_maps = _build_index_maps(value_maps)
+    # Resolve field lists and their index maps once, outside the entry loop
+    scalar_fields = tuple(scalar_fields)
+    graph_specs = tuple((gf, index_maps.get(gf)) for gf in graph_fields)
+    _isinstance = isinstance
+    _str = str
+    append = concepts.append
 
     for name, entry in ontology.items():
         # v3.0: campos aplanados na raiz (sem sub-dict "fields")
         props: Dict[str, Any] = {
             "name": name,
             "description": entry.get("description"),
-            "created": int(time.time())
+            "created": created_at,
+            **{sf: entry[sf] for sf in scalar_fields if sf in entry},
         }
 
-        for sf in scalar_fields:
-            if sf in entry:
-                props[sf] = entry[sf]
-
         relations: Dict[str, List[str]] = {}
-        for gf in graph_fields:
-            if gf in entry:
-                raw_val = entry[gf]
-                # Convert value to label if mapping exists
-                if gf in value_maps:
-                    if isinstance(raw_val, list):
-                        relations[gf] = [_index_to_label(v, value_maps[gf]) for v in raw_val]
-                    else:
-                        relations[gf] = [_index_to_label(raw_val, value_maps[gf])]
-                else:
-                    # No mapping, use value directly
-                    relations[gf] = raw_val if isinstance(raw_val, list) else [raw_val]
+        for gf, index_map in graph_specs:
+            if gf not in entry:
+                continue
+            raw_val = entry[gf]
+            values = raw_val if _isinstance(raw_val, list) else [raw_val]
+            if index_map is None:
+                # No mapping, use value directly
+                relations[gf] = values
+            else:
+                # Convert numeric indices to labels via the prebuilt index lookup
+                relations[gf] = [
+                    index_map.get(v, _str(v)) if _isinstance(v, int) else _str(v)
+                    for v in values
+                ]
 
-        concepts.append({"props": props, "relations": relations})
+        append({"props": props, "relations": relations})
 
     return concepts
 
@@ -621,7 +893,7 @@ def _extract_corpus_data(
     corpus: List[Dict[str, Any]],
     bibliography: Dict[str, Any],
     relation_definitions: Dict[str, str],
-    code_field_names: List[str],
+    code_field_names: Sequence[str],
     source_fields: List[str],
     memo_field_name: str = "note",
 ) -> tuple[
@@ -644,108 +916,175 @@ def _extract_corpus_data(
     is a single string shared across all triples of a chained sequence, that string is
     used as the description for every triple in the item.
     """
-    sources: List[Dict[str, Any]] = []
+    # Same definitions keyed by normalized relation type ("contested-by" -> "CONTESTED_BY"),
+    # so a triple whose spelling differs from the template still finds its description
+    normalized_definitions: Dict[str, str] = {}
+    for rel, description in relation_definitions.items():
+        normalized_definitions.setdefault(rel.translate(_RELATION_TYPE_TRANS).upper(), description)
+
+    sources_by_ref: Dict[str, Dict[str, Any]] = {}
     items: List[Dict[str, Any]] = []
     mentions: List[Dict[str, Any]] = []
     chains: List[Dict[str, Any]] = []
     from_source: List[Dict[str, Any]] = []
-    seen_refs: set[str] = set()
 
     for corpus_item in corpus:
-        source_ref = corpus_item["source_ref"].lstrip("@")
+        # Interned: the same ref is repeated on every from_source row of the source
+        source_ref = sys.intern(corpus_item["source_ref"].lstrip("@"))
         corpus_id = corpus_item["id"]
 
         # Extract source (SOURCE...END SOURCE block)
-        if source_ref not in seen_refs:
-            source_props = _build_source_props(source_ref, corpus_item, bibliography, source_fields)
-            sources.append(source_props)
-            seen_refs.add(source_ref)
+        if source_ref not in sources_by_ref:
+            sources_by_ref[source_ref] = _build_source_props(
+                source_ref, corpus_item, bibliography, source_fields
+            )
 
         data = corpus_item["data"]
 
-        # Detect template pattern
-        has_chain = "chain" in data and data["chain"]
-        has_code = any(cf in data and data[cf] for cf in code_field_names)
-
-        if has_chain:
-            chain_list = data.get("chain", [])
-            raw_memo = data.get(memo_field_name, [])
-            # Parallel list: one note per triple (bibliometrics format).
-            # Single string or absent: shared description across all triples (causation format).
-            notes: List[str] = raw_memo if isinstance(raw_memo, list) else []
-            shared_note: str = raw_memo if isinstance(raw_memo, str) else ""
-            base_text: str = (
-                data.get("text") or data.get("citação") or data.get("citation") or ""
+        chain_list = data.get("chain")
+        if chain_list:
+            _extract_chain_row(
+                data, chain_list, corpus_id, source_ref, memo_field_name,
+                relation_definitions, normalized_definitions,
+                items, mentions, chains, from_source,
             )
+        else:
+            # CODE pattern: first CODE field with data, found in one scan
+            for cf in code_field_names:
+                if data.get(cf):
+                    _extract_code_row(
+                        data, data[cf], corpus_id, source_ref,
+                        items, mentions, from_source,
+                    )
+                    break
 
-            for idx, chain in enumerate(chain_list, 1):
-                note = notes[idx - 1] if idx - 1 < len(notes) else shared_note
-                item_id = f"{corpus_id}_n{idx:04d}"
-
-                items.append({
-                    "item_id": item_id,
-                    "citation": base_text,
-                    "description": note,
-                })
-                from_source.append({"item_id": item_id, "ref": source_ref})
-
-                # v3.0: chains como {from, relation, to}
-                src = chain.get("from", "").strip()
-                rel = chain.get("relation", "").strip()
-                tgt = chain.get("to", "").strip()
-                if src and tgt:
-                    mentions.append({"item_id": item_id, "concept": src, "mention_order": 1})
-                    mentions.append({"item_id": item_id, "concept": tgt, "mention_order": 2})
-
-                    # Normalize relation type and lookup description
-                    rel_type = rel.upper().replace(" ", "_").replace("-", "_")
-                    rel_description = relation_definitions.get(rel, "")
-
-                    chains.append({
-                        "source": src,
-                        "target": tgt,
-                        "type": rel_type,
-                        "description": rel_description,
-                        "item_id": item_id,
-                    })
-
-        elif has_code:
-            # CODE pattern (gestao_fe): code field bundles
-            # Find the first CODE field with data
-            code_field = next((cf for cf in code_field_names if cf in data and data[cf]), None)
-            if not code_field:
-                continue
+    sources = list(sources_by_ref.values())
+    return sources, items, mentions, chains, from_source
 
-            code_list = data[code_field]
-            if not isinstance(code_list, list):
-                code_list = [code_list]
-
-            # Extract descriptions if available (corresponding bundled field)
-            descriptions = data.get("justificativa_interna", []) or data.get("descricao", [])
-            if not isinstance(descriptions, list):
-                descriptions = [descriptions] * len(code_list)
-
-            # Extract base text (first MEMO or TEXT field found)
-            base_text = ""
-            for field_name in ["ordem_1a", "text", "citation"]:
-                if field_name in data and data[field_name]:
-                    val = data[field_name]
-                    base_text = val[0] if isinstance(val, list) else val
-                    break
 
-            for idx, code in enumerate(code_list, 1):
-                item_id = f"{corpus_id}_c{idx:04d}"
-                description = descriptions[idx-1] if idx <= len(descriptions) else ""
+def _item_id_template(corpus_id: Any, kind: str) -> str:
+    """printf template for the item ids of a corpus row ("<id>_n0001", "<id>_c0001")."""
+    return f"{str(corpus_id).replace('%', '%%')}_{kind}%04d"
 
-                items.append({
-                    "item_id": item_id,
-                    "citation": base_text,
-                    "description": description
-                })
-                from_source.append({"item_id": item_id, "ref": source_ref})
-                mentions.append({"item_id": item_id, "concept": code, "mention_order": 1})
 
-    return sources, items, mentions, chains, from_source
+def _extract_chain_row(
+    data: Dict[str, Any],
+    chain_list: List[Dict[str, Any]],
+    corpus_id: str,
+    source_ref: str,
+    memo_field_name: str,
+    relation_definitions: Dict[str, str],
+    normalized_definitions: Dict[str, str],
+    items: List[Dict[str, Any]],
+    mentions: List[Dict[str, Any]],
+    chains: List[Dict[str, Any]],
+    from_source: List[Dict[str, Any]],
+) -> None:
+    """Appends the items, mentions and RELATES_TO rows of a CHAIN corpus row."""
+    raw_memo = data.get(memo_field_name, [])
+    # Parallel list: one note per triple (bibliometrics format).
+    # Single string or absent: shared description across all triples (causation format).
+    notes: List[str] = raw_memo if isinstance(raw_memo, list) else []
+    shared_note: str = raw_memo if isinstance(raw_memo, str) else ""
+    base_text: str = (
+        data.get("text") or data.get("citação") or data.get("citation") or ""
+    )
+
+    # Items and source links are one per triple: extend in bulk per row
+    n_triples = len(chain_list)
+    item_id_template = _item_id_template(corpus_id, "n")
+    item_ids = [item_id_template % idx for idx in range(1, n_triples + 1)]
+    n_notes = len(notes)
+    items.extend([
+        {
+            "item_id": item_ids[i],
+            "citation": base_text,
+            "description": notes[i] if i < n_notes else shared_note,
+        }
+        for i in range(n_triples)
+    ])
+    from_source.extend([{"item_id": item_id, "ref": source_ref} for item_id in item_ids])
+
+    for i in range(n_triples):
+        chain = chain_list[i]
+        item_id = item_ids[i]
+        # v3.0: chains como {from, relation, to}
+        # Concept names and relation types repeat across the corpus: intern them
+        # so every mention/chain row shares one string object
+        src = chain.get("from", "").strip()
+        if not src:
+            continue
+        tgt = chain.get("to", "").strip()
+        if tgt:
+            src = sys.intern(src)
+            tgt = sys.intern(tgt)
+            rel = chain.get("relation", "").strip()
+            mentions.extend((
+                {"item_id": item_id, "concept": src, "mention_order": 1},
+                {"item_id": item_id, "concept": tgt, "mention_order": 2},
+            ))
+
+            # Normalize relation type and lookup description
+            rel_type = sys.intern(rel.translate(_RELATION_TYPE_TRANS).upper())
+            rel_description = relation_definitions.get(rel)
+            if rel_description is None:
+                rel_description = normalized_definitions.get(rel_type, "")
+
+            chains.append({
+                "source": src,
+                "target": tgt,
+                "type": rel_type,
+                "description": rel_description,
+                "item_id": item_id,
+            })
+
+
+def _extract_code_row(
+    data: Dict[str, Any],
+    code_list: Any,
+    corpus_id: str,
+    source_ref: str,
+    items: List[Dict[str, Any]],
+    mentions: List[Dict[str, Any]],
+    from_source: List[Dict[str, Any]],
+) -> None:
+    """Appends the items and mentions of a CODE corpus row (gestao_fe: code field bundles)."""
+    if not isinstance(code_list, list):
+        code_list = [code_list]
+
+    # Extract descriptions if available (corresponding bundled field)
+    descriptions = data.get("justificativa_interna", []) or data.get("descricao", [])
+    if not isinstance(descriptions, list):
+        descriptions = [descriptions] * len(code_list)
+
+    # Extract base text (first MEMO or TEXT field found)
+    base_text = ""
+    for field_name in ["ordem_1a", "text", "citation"]:
+        if field_name in data and data[field_name]:
+            val = data[field_name]
+            base_text = val[0] if isinstance(val, list) else val
+            break
+
+    n_codes = len(code_list)
+    item_id_template = _item_id_template(corpus_id, "c")
+    item_ids = [item_id_template % idx for idx in range(1, n_codes + 1)]
+    n_descriptions = len(descriptions)
+    items.extend([
+        {
+            "item_id": item_ids[i],
+            "citation": base_text,
+            "description": descriptions[i] if i < n_descriptions else "",
+        }
+        for i in range(n_codes)
+    ])
+    from_source.extend([{"item_id": item_id, "ref": source_ref} for item_id in item_ids])
+    # Codes repeat across the corpus: intern them so mention rows share one string
+    _intern = sys.intern
+    codes = [_intern(code) if isinstance(code, str) else code for code in code_list]
+    mentions.extend([
+        {"item_id": item_ids[i], "concept": codes[i], "mention_order": 1}
+        for i in range(n_codes)
+    ])
 
 
 def _build_source_props(
@@ -780,50 +1119,173 @@ def _build_source_props(
 # ============================================================================
 # NEO4J SYNCHRONIZATION
 # ============================================================================
-def clear_database(session: Any) -> None:
+# Nodes deleted per inner transaction when clearing through APOC
+_CLEAR_BATCH_SIZE = 10000
+
+
+def clear_database(
+    session: Any,
+    apoc_available: Optional[bool] = None,
+    schema_names: Optional[tuple[List[str], List[str]]] = None
+) -> None:
     """
     Clears all data from the database, including constraints and indexes.
 
-    Ensures that the source of truth is always the compiler data.
+    Ensures that the source of truth is always the compiler data. Schema names
+    are collected in one query each (or reused from schema_names, as returned by
+    _schema_names); with APOC installed the drops run in a single UNWIND and the
+    node delete is committed in batches. Nothing is dropped on an empty schema.
     """
+    if apoc_available is None:
+        apoc_available = _is_apoc_available(session)
+    if schema_names is None:
+        schema_names = _schema_names(session)
+    constraint_names, index_names = schema_names
+
     # Remove all existing constraints
-    constraints = session.run("SHOW CONSTRAINTS").data()
-    for c in constraints:
-        constraint_name = c.get("name")
-        if constraint_name:
-            session.run(f"DROP CONSTRAINT {constraint_name} IF EXISTS")
+    _drop_schema_objects(session, "CONSTRAINT", constraint_names, apoc_available)
 
     # Remove all existing indexes (except automatically created ones)
-    indexes = session.run("SHOW INDEXES").data()
-    for idx in indexes:
-        if idx.get("owningConstraint") is None:  # Not a constraint index
-            idx_name = idx.get("name")
-            if idx_name:
-                session.run(f"DROP INDEX {idx_name} IF EXISTS")
+    _drop_schema_objects(session, "INDEX", index_names, apoc_available)
 
     # Clear all nodes and relationships
-    session.run("MATCH (n) DETACH DELETE n")
+    _delete_all_nodes(session, apoc_available)
 
 
-def sync_to_neo4j(session: Any, payload: GraphPayload) -> Optional[SyncError]:
+def _delete_all_nodes(session: Any, apoc_available: bool) -> None:
     """
-    Synchronizes payload with Neo4j in a single transaction.
+    Deletes all nodes and relationships in batches of _CLEAR_BATCH_SIZE.
+
+    Uses apoc.periodic.iterate when installed, otherwise CALL {} IN TRANSACTIONS
+    (auto-commit only, Neo4j 4.4+), so no single transaction holds the whole graph.
+    """
+    if apoc_available:
+        _run_periodic_iterate(session, "MATCH (n) RETURN n", "DETACH DELETE n", _CLEAR_BATCH_SIZE)
+    else:
+        session.run(
+            "MATCH (n) CALL { WITH n DETACH DELETE n } "
+            f"IN TRANSACTIONS OF {_CLEAR_BATCH_SIZE} ROWS"
+        ).consume()
+
+
+def _run_periodic_iterate(session: Any, outer: str, inner: str, batch_size: int) -> None:
+    """
+    Runs apoc.periodic.iterate serially, raising if any batch failed.
+
+    The procedure reports failed batches in its result rows instead of raising,
+    so an unchecked call would leave a partial write unnoticed.
+    """
+    record = session.run(
+        "CALL apoc.periodic.iterate($outer, $inner, {batchSize: $batch_size, parallel: false}) "
+        "YIELD failedBatches, errorMessages "
+        "RETURN failedBatches, errorMessages",
+        outer=outer,
+        inner=inner,
+        batch_size=batch_size,
+    ).single()
+    if record is not None and record["failedBatches"]:
+        raise RuntimeError(
+            f"apoc.periodic.iterate: {record['failedBatches']} batch(es) failed: "
+            f"{record['errorMessages']}"
+        )
+
+
+# Plugin probe results, per driver (dropped with the driver)
+_PLUGIN_PROBE_CACHE: "weakref.WeakKeyDictionary[Any, Dict[str, bool]]" = weakref.WeakKeyDictionary()
+
+
+def _get_cached_probe(driver: Any, plugin: str) -> Optional[bool]:
+    """Returns the cached availability of a plugin for the driver, if known."""
+    if driver is None:
+        return None
+    try:
+        return _PLUGIN_PROBE_CACHE.get(driver, {}).get(plugin)
+    except TypeError:  # not weak-referenceable
+        return None
+
+
+def _set_cached_probe(driver: Any, plugin: str, available: bool) -> None:
+    """Remembers a plugin probe result for the driver (no-op without one)."""
+    if driver is None:
+        return
+    try:
+        _PLUGIN_PROBE_CACHE.setdefault(driver, {})[plugin] = available
+    except TypeError:
+        pass
+
+
+def _is_apoc_available(session: Any, driver: Any = None) -> bool:
+    """Checks if the APOC plugin is installed (probed once per driver, if given)."""
+    cached = _get_cached_probe(driver, "apoc")
+    if cached is not None:
+        return cached
+    try:
+        session.run("RETURN apoc.version() AS version").single()["version"]
+        available = True
+    except Exception:
+        available = False
+    _set_cached_probe(driver, "apoc", available)
+    return available
+
+
+def _drop_schema_objects(session: Any, kind: str, names: List[str], apoc_available: bool) -> None:
+    """Drops constraints or indexes by name (kind: "CONSTRAINT" or "INDEX")."""
+    names = [name for name in names if name]
+    if not names:
+        return
+    if apoc_available:
+        session.run(
+            "UNWIND $names AS name "
+            f"CALL apoc.cypher.runSchema('DROP {kind} `' + replace(name, '`', '``') + '` IF EXISTS', {{}}) "
+            "YIELD value RETURN count(*)",
+            names=names,
+        ).consume()
+        return
+    for name in names:
+        session.run(f"DROP {kind} {name} IF EXISTS")
+
+
+def sync_to_neo4j(
+    session: Any,
+    payload: GraphPayload,
+    driver: Any = None,
+    database: Optional[str] = None,
+    workers: int = 1,
+) -> Optional[SyncError]:
+    """
+    Synchronizes payload with Neo4j.
 
     Clears the database completely before synchronizing, ensuring that
-    the compiler is the source of truth.
+    the compiler is the source of truth. With workers = 1 the data is written
+    in a single transaction; with workers > 1 the writes are split over several
+    transactions, so a failure can leave a partially written graph.
 
     Args:
         session: Active Neo4j session
         payload: Data prepared for persistence
+        driver: Driver used to open extra sessions when workers > 1
+        database: Database of the extra sessions
+        workers: Number of concurrent sessions (1 = single transaction)
 
     Returns:
         None on success, SyncError on failure.
     """
     try:
-        # Clear database before synchronizing (source of truth = compiler)
-        clear_database(session)
-        _create_constraints(session, payload.graph_fields, payload.concept_label)
-        _execute_sync_transaction(session, payload)
+        # Clear database before synchronizing (source of truth = compiler).
+        # Re-syncing a project whose schema is already in place only replaces the data.
+        apoc_available = _is_apoc_available(session, driver)
+        expected_constraints = _constraint_statements(payload.graph_fields, payload.concept_label)
+        # One schema listing serves both the fast-path check and the clear
+        schema_names = _schema_names(session)
+        if _schema_matches(schema_names, expected_constraints):
+            _delete_all_nodes(session, apoc_available)
+        else:
+            clear_database(session, apoc_available, schema_names=schema_names)
+            _create_constraints(session, payload.graph_fields, payload.concept_label, apoc_available)
+        if workers > 1 and driver is not None:
+            _execute_parallel_sync(driver, database, payload, workers, apoc_available)
+        else:
+            _execute_sync_transaction(session, payload)
         return None
     except Exception as e:
         return SyncError(
@@ -901,69 +1363,256 @@ def sync_to_graphqlite(conn: Any, payload: GraphPayload) -> Optional[SyncError]:
         )
 
 
-def _create_constraints(session: Any, graph_fields: List[str], concept_label: str) -> None:
-    """Creates uniqueness constraints in Neo4j schema."""
-    # Constraints for dynamic taxonomies
-    for label in get_taxonomy_labels(graph_fields):
-        if validate_cypher_label(label):
-            session.run(
-                f"CREATE CONSTRAINT IF NOT EXISTS FOR (n:{label}) REQUIRE n.name IS UNIQUE"
-            )
+# Seconds to wait for constraint-backing indexes to come online before syncing
+_INDEX_AWAIT_TIMEOUT_S = 300
 
-    # Fixed constraints
-    session.run("CREATE CONSTRAINT IF NOT EXISTS FOR (s:Source) REQUIRE s.bibtex IS UNIQUE")
-    session.run("CREATE CONSTRAINT IF NOT EXISTS FOR (i:Item) REQUIRE i.item_id IS UNIQUE")
 
-    # Constraint for dynamic label (based on CHAIN/CODE field)
+def _constraint_statements(graph_fields: List[str], concept_label: str) -> Dict[str, str]:
+    """Maps the stable name of each uniqueness constraint to its CREATE statement."""
+    labels = [label for label in get_taxonomy_labels(graph_fields) if validate_cypher_label(label)]
+    # Dynamic label (based on CHAIN/CODE field)
     if validate_cypher_label(concept_label):
-        session.run(
-            f"CREATE CONSTRAINT IF NOT EXISTS FOR (c:{concept_label}) REQUIRE c.name IS UNIQUE"
+        labels.append(concept_label)
+
+    statements: Dict[str, str] = {
+        f"unique_{label}_name": (
+            f"CREATE CONSTRAINT unique_{label}_name IF NOT EXISTS "
+            f"FOR (n:{label}) REQUIRE n.name IS UNIQUE"
         )
+        for label in labels
+    }
+    # Fixed constraints
+    statements["unique_Source_bibtex"] = (
+        "CREATE CONSTRAINT unique_Source_bibtex IF NOT EXISTS "
+        "FOR (s:Source) REQUIRE s.bibtex IS UNIQUE"
+    )
+    statements["unique_Item_item_id"] = (
+        "CREATE CONSTRAINT unique_Item_item_id IF NOT EXISTS "
+        "FOR (i:Item) REQUIRE i.item_id IS UNIQUE"
+    )
+    return statements
+
+
+def _schema_names(session: Any) -> tuple[List[str], List[str]]:
+    """Names of all constraints and of the indexes not owned by a constraint."""
+    constraint_names = session.run(
+        "SHOW CONSTRAINTS YIELD name RETURN collect(name) AS names"
+    ).single()["names"]
+    index_names = session.run(
+        "SHOW INDEXES YIELD name, owningConstraint "
+        "WHERE owningConstraint IS NULL RETURN collect(name) AS names"
+    ).single()["names"]
+    return constraint_names, index_names
+
+
+def _schema_matches(schema_names: tuple[List[str], List[str]], expected_constraints: Dict[str, str]) -> bool:
+    """True when the database holds exactly the expected constraints and no other index."""
+    constraint_names, index_names = schema_names
+    return set(constraint_names) == set(expected_constraints) and not index_names
+
+
+def _create_constraints(
+    session: Any,
+    graph_fields: List[str],
+    concept_label: str,
+    apoc_available: bool = False
+) -> None:
+    """Creates uniqueness constraints in Neo4j schema (in one call when APOC is installed)."""
+    statements = list(_constraint_statements(graph_fields, concept_label).values())
+    if apoc_available:
+        session.run(
+            "UNWIND $statements AS statement "
+            "CALL apoc.cypher.runSchema(statement, {}) YIELD value RETURN count(*)",
+            statements=statements,
+        ).consume()
+    else:
+        for statement in statements:
+            session.run(statement)
+
+    # Each constraint is backed by an index on the MERGE key; wait until they
+    # are online so the bulk MERGEs below use index seeks instead of label scans
+    try:
+        session.run(f"CALL db.awaitIndexes({_INDEX_AWAIT_TIMEOUT_S})").consume()
+    except Exception as e:
+        logger.debug(f"db.awaitIndexes unavailable or timed out: {e}")
+
+
+# Rows sent per UNWIND statement (bounds message size and per-statement memory)
+_SYNC_BATCH_SIZE = 1000
+
+
+def _chunked(rows: List[Any], size: int = _SYNC_BATCH_SIZE) -> Iterator[List[Any]]:
+    """Yields consecutive slices of at most `size` rows."""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _run_batched(tx: Any, query: str, rows: List[Any]) -> None:
+    """Runs an `UNWIND $rows` query once per batch of rows."""
+    for batch in _chunked(rows, _SYNC_BATCH_SIZE):
+        tx.run(query, rows=batch)
+
+
+def _rows_to_columns(rows: List[Dict[str, Any]], columns: Sequence[str]) -> Dict[str, List[Any]]:
+    """Transposes row dicts into one list per column (keys are sent once, not per row)."""
+    return {col: [row.get(col) for row in rows] for col in columns}
+
+
+def _run_batched_columns(tx: Any, query: str, rows: List[Dict[str, Any]], columns: Sequence[str]) -> None:
+    """Runs a columnar query (`UNWIND range(0, size($col) - 1) AS idx`) once per batch of rows."""
+    for batch in _chunked(rows, _SYNC_BATCH_SIZE):
+        tx.run(query, **_rows_to_columns(batch, columns))
 
 
 def _execute_sync_transaction(session: Any, payload: GraphPayload) -> None:
     """Executes all sync operations in a single transaction."""
     with session.begin_transaction() as tx:
-        _sync_sources(tx, payload.sources)
-        _sync_items(tx, payload.items)
-        _sync_from_source(tx, payload.from_source)
+        _sync_sources_and_items(tx, payload.sources, payload.items)
+        _sync_from_source(tx, payload.from_source, columnar=True)
         _sync_concepts(tx, payload.chains, payload.concepts, payload.concept_label)
-        _sync_taxonomies(tx, payload.concepts, payload.graph_fields, payload.concept_label)
-        _sync_mentions(tx, payload.mentions, payload.concept_label)
+        _sync_taxonomies(tx, payload.concepts, payload.graph_fields, payload.concept_label, per_topic=True)
+        _sync_mentions(tx, payload.mentions, payload.concept_label, columnar=True)
         tx.commit()
 
 
+def _execute_parallel_sync(
+    driver: Any,
+    database: Optional[str],
+    payload: GraphPayload,
+    workers: int,
+    apoc_available: bool = False
+) -> None:
+    """
+    Executes the sync steps on concurrent sessions, in two phases.
+
+    Phase 1 writes nodes (sources, items, concepts with RELATES_TO); phase 2
+    writes the relationships that MATCH them (FROM_SOURCE, taxonomies,
+    MENTIONS). Every statement (one UNWIND batch) commits in its own write
+    transaction, retried by the driver on transient errors (e.g. lock
+    contention), so transaction size stays bounded but the sync is no longer
+    atomic as a whole. With APOC, Topic IS_LINKED_TO is aggregated in a third
+    phase, in batches, once GROUPED_BY is committed.
+    """
+    label = payload.concept_label
+    link_topics_batched = apoc_available and "topic" in payload.graph_fields
+    phases = [
+        [
+            lambda tx: _sync_sources(tx, payload.sources),
+            lambda tx: _sync_items(tx, payload.items),
+            lambda tx: _sync_concepts(tx, payload.chains, payload.concepts, label),
+        ],
+        [
+            lambda tx: _sync_from_source(tx, payload.from_source, columnar=True),
+            lambda tx: _sync_taxonomies(
+                tx, payload.concepts, payload.graph_fields, label,
+                per_topic=True, link_topics=not link_topics_batched,
+            ),
+            lambda tx: _sync_mentions(tx, payload.mentions, label, columnar=True),
+        ],
+    ]
+
+    def run_step(step: Any) -> None:
+        with driver.session(database=database) as step_session:
+            step(_BatchCommitRunner(step_session))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for steps in phases:
+            # list() waits for the whole phase and re-raises the first failure
+            list(executor.map(run_step, steps))
+
+    if link_topics_batched:
+        # apoc.periodic.iterate commits its own batches (auto-commit session)
+        with driver.session(database=database) as link_session:
+            _link_topics_batched(link_session, label)
+
+
+class _BatchCommitRunner:
+    """
+    Adapts a Neo4j session to the tx.run(query, **params) interface, committing
+    each statement in its own managed write transaction.
+
+    Sync statements are idempotent MERGEs, so a retried batch is safe.
+    """
+
+    def __init__(self, session: Any):
+        self.session = session
+
+    def run(self, query: str, **params: Any) -> Any:
+        return self.session.execute_write(lambda tx: tx.run(query, **params).consume())
+
+
 def _sync_sources(tx: Any, sources: List[Dict[str, Any]]) -> None:
     """Synchronizes Source nodes (corresponding to SOURCE...END SOURCE block)."""
     if not sources:
         return
-    tx.run("""
+    _run_batched(tx, """
         UNWIND $rows AS row
         MERGE (s:Source {bibtex: row.bibtex})
         SET s = row, s.last_updated = timestamp()
-    """, rows=sources)
+    """, sources)
+
+
+def _sync_sources_and_items(tx: Any, sources: List[Dict[str, Any]], items: List[Dict[str, Any]]) -> None:
+    """
+    Synchronizes Source and Item nodes together, one statement per pair of batches.
+
+    The two MERGEs touch disjoint labels, so they run as unit subqueries of the
+    same statement: one round trip per batch instead of one per label (Neo4j only).
+    """
+    if not sources and not items:
+        return
+    source_batches = list(_chunked(sources, _SYNC_BATCH_SIZE))
+    item_batches = list(_chunked(items, _SYNC_BATCH_SIZE))
+    for source_batch, item_batch in zip_longest(source_batches, item_batches, fillvalue=[]):
+        tx.run("""
+            CALL {
+                UNWIND $sources AS row
+                MERGE (s:Source {bibtex: row.bibtex})
+                SET s = row, s.last_updated = timestamp()
+            }
+            CALL {
+                UNWIND $items AS row
+                MERGE (i:Item {item_id: row.item_id})
+                SET i = row, i.last_updated = timestamp()
+            }
+        """, sources=source_batch, items=item_batch)
 
 
 def _sync_items(tx: Any, items: List[Dict[str, Any]]) -> None:
     if not items:
         return
-    tx.run("""
+    _run_batched(tx, """
         UNWIND $rows AS row
         MERGE (i:Item {item_id: row.item_id})
         SET i = row, i.last_updated = timestamp()
-    """, rows=items)
+    """, items)
 
 
-def _sync_from_source(tx: Any, from_source: List[Dict[str, Any]]) -> None:
-    """Connects Item to the Source from which it was extracted."""
+def _sync_from_source(tx: Any, from_source: List[Dict[str, Any]], columnar: bool = False) -> None:
+    """
+    Connects Item to the Source from which it was extracted.
+
+    With columnar=True (Neo4j) rows travel as one list per column, so keys are
+    not repeated per row; GraphQLite indexes list parameters slowly and keeps
+    the row form.
+    """
     if not from_source:
         return
-    tx.run("""
+    if columnar:
+        _run_batched_columns(tx, """
+            UNWIND range(0, size($item_id) - 1) AS idx
+            WITH $item_id[idx] AS item_id, $ref[idx] AS ref
+            MATCH (i:Item {item_id: item_id})
+            MATCH (s:Source {bibtex: ref})
+            MERGE (i)-[:FROM_SOURCE]->(s)
+        """, from_source, ("item_id", "ref"))
+        return
+    _run_batched(tx, """
         UNWIND $rows AS row
         MATCH (i:Item {item_id: row.item_id})
         MATCH (s:Source {bibtex: row.ref})
         MERGE (i)-[:FROM_SOURCE]->(s)
-    """, rows=from_source)
+    """, from_source)
 
 
 # Mapping of fields to semantic relationship names
@@ -980,11 +1629,30 @@ def _get_taxonomy_relation(field_name: str) -> str:
     return TAXONOMY_RELATION_MAP.get(field_name.lower(), f"HAS_{field_name.upper()}")
 
 
+@lru_cache(maxsize=64)
+def _taxonomy_specs(graph_fields: tuple[str, ...]) -> tuple[tuple[str, str, str], ...]:
+    """
+    Resolves (field_name, label, rel_type) for every graph field, once per field set.
+
+    Fields whose label or relationship type is not a safe Cypher identifier are
+    left out, so sync and metrics share the same validated list.
+    """
+    specs = []
+    for field_name in graph_fields:
+        label = sanitize_cypher_label(field_name.capitalize())
+        rel_type = _get_taxonomy_relation(field_name)
+        if validate_cypher_label(label) and validate_cypher_label(rel_type):
+            specs.append((field_name, label, rel_type))
+    return tuple(specs)
+
+
 def _sync_taxonomies(
     tx: Any,
     concepts: List[Dict[str, Any]],
     graph_fields: List[str],
-    concept_label: str
+    concept_label: str,
+    per_topic: bool = False,
+    link_topics: bool = True
 ) -> None:
     """
     Creates taxonomy nodes and semantic relationships from concept nodes.
@@ -996,109 +1664,70 @@ def _sync_taxonomies(
     - Topic -> Topic via IS_LINKED_TO (self-referential)
     - Topic -> Aspect via MAPPED_TO_ASPECT
     - Topic -> Dimension via MAPPED_TO_DIMENSION
+
+    With per_topic=True (Neo4j) IS_LINKED_TO strengths are aggregated in a
+    subquery per source Topic, bounding the grouping state to one topic's
+    neighbours; GraphQLite does not evaluate the subquery form correctly.
+    With link_topics=False IS_LINKED_TO is left to the caller (_link_topics_batched).
     """
     if not concepts:
         return
 
     # First: create taxonomy nodes and Concept -> Taxonomy relations
-    for field_name in graph_fields:
-        label = sanitize_cypher_label(field_name.capitalize())
-        rel_type = _get_taxonomy_relation(field_name)
-
-        if not validate_cypher_label(label) or not validate_cypher_label(rel_type):
-            continue
-
-        relation_rows: List[Dict[str, Any]] = []
-        for row in concepts:
-            props = row.get("props", {})
-            relations = row.get("relations", {})
-            if not isinstance(props, dict) or not isinstance(relations, dict):
-                continue
-
-            concept_name = props.get("name")
-            raw_vals = relations.get(field_name)
-            if concept_name is None or raw_vals is None:
-                continue
-
-            vals = raw_vals if isinstance(raw_vals, list) else [raw_vals]
-            vals = [v for v in vals if v is not None]
-            if not vals:
-                continue
-
-            relation_rows.append({"concept": concept_name, "vals": vals})
-
-        if not relation_rows:
+    taxonomy_batches = _build_taxonomy_batches(concepts, graph_fields)
+    for field_name, label, rel_type in _taxonomy_specs(tuple(graph_fields)):
+        pair_rows = taxonomy_batches[field_name]
+        if not pair_rows:
             continue
 
         query = f"""
             UNWIND $rows AS row
             MATCH (c:{concept_label} {{name: row.concept}})
-            UNWIND row.vals AS val
-            MERGE (t:{label} {{name: val}})
+            MERGE (t:{label} {{name: row.val}})
             MERGE (c)-[:{rel_type}]->(t)
         """
-        tx.run(query, rows=relation_rows)
+        _run_batched(tx, query, pair_rows)
 
-    # Second: create mapping relations between taxonomies
+    # Second: create mapping relations between taxonomies, one row per distinct pair
     # Topic -> Aspect (MAPPED_TO_ASPECT)
     if "topic" in graph_fields and "aspect" in graph_fields:
-        mapping_rows: List[Dict[str, Any]] = []
-        for row in concepts:
-            relations = row.get("relations", {})
-            if not isinstance(relations, dict):
-                continue
-            topics_raw = relations.get("topic")
-            aspects_raw = relations.get("aspect")
-            if topics_raw is None or aspects_raw is None:
-                continue
-            topics = topics_raw if isinstance(topics_raw, list) else [topics_raw]
-            aspects = aspects_raw if isinstance(aspects_raw, list) else [aspects_raw]
-            topics = [t for t in topics if t is not None]
-            aspects = [a for a in aspects if a is not None]
-            if topics and aspects:
-                mapping_rows.append({"topics": topics, "aspects": aspects})
-
-        if mapping_rows:
-            tx.run("""
+        pair_rows = _taxonomy_pair_rows(concepts, "topic", "aspect")
+        if pair_rows:
+            _run_batched(tx, """
                 UNWIND $rows AS row
-                UNWIND row.topics AS topic_val
-                UNWIND row.aspects AS aspect_val
-                MATCH (topic:Topic {name: topic_val})
-                MATCH (aspect:Aspect {name: aspect_val})
+                MATCH (topic:Topic {name: row.topic})
+                MATCH (aspect:Aspect {name: row.aspect})
                 MERGE (topic)-[:MAPPED_TO_ASPECT]->(aspect)
-            """, rows=mapping_rows)
+            """, pair_rows)
 
     # Topic -> Dimension (MAPPED_TO_DIMENSION)
     if "topic" in graph_fields and "dimension" in graph_fields:
-        mapping_rows: List[Dict[str, Any]] = []
-        for row in concepts:
-            relations = row.get("relations", {})
-            if not isinstance(relations, dict):
-                continue
-            topics_raw = relations.get("topic")
-            dimensions_raw = relations.get("dimension")
-            if topics_raw is None or dimensions_raw is None:
-                continue
-            topics = topics_raw if isinstance(topics_raw, list) else [topics_raw]
-            dimensions = dimensions_raw if isinstance(dimensions_raw, list) else [dimensions_raw]
-            topics = [t for t in topics if t is not None]
-            dimensions = [d for d in dimensions if d is not None]
-            if topics and dimensions:
-                mapping_rows.append({"topics": topics, "dimensions": dimensions})
-
-        if mapping_rows:
-            tx.run("""
+        pair_rows = _taxonomy_pair_rows(concepts, "topic", "dimension")
+        if pair_rows:
+            _run_batched(tx, """
                 UNWIND $rows AS row
-                UNWIND row.topics AS topic_val
-                UNWIND row.dimensions AS dimension_val
-                MATCH (topic:Topic {name: topic_val})
-                MATCH (dimension:Dimension {name: dimension_val})
+                MATCH (topic:Topic {name: row.topic})
+                MATCH (dimension:Dimension {name: row.dimension})
                 MERGE (topic)-[:MAPPED_TO_DIMENSION]->(dimension)
-            """, rows=mapping_rows)
+            """, pair_rows)
 
     # Topic -> Topic (IS_LINKED_TO) - connects topics via RELATES_TO between their concepts
     # strength = number of RELATES_TO relations between concepts of both topics
-    if "topic" in graph_fields:
+    if "topic" not in graph_fields or not link_topics:
+        return
+    if per_topic:
+        tx.run(f"""
+            MATCH (t1:Topic)
+            CALL {{
+                WITH t1
+                MATCH (t1)<-[:GROUPED_BY]-(f1:{concept_label})-[:RELATES_TO]->(f2:{concept_label})-[:GROUPED_BY]->(t2:Topic)
+                WHERE t1 <> t2
+                WITH t1, t2, count(*) AS strength
+                MERGE (t1)-[r:IS_LINKED_TO]->(t2)
+                SET r.strength = strength, r.last_updated = timestamp()
+            }}
+        """)
+    else:
         tx.run(f"""
             MATCH (t1:Topic)<-[:GROUPED_BY]-(f1:{concept_label})-[:RELATES_TO]->(f2:{concept_label})-[:GROUPED_BY]->(t2:Topic)
             WHERE t1 <> t2
@@ -1108,16 +1737,105 @@ def _sync_taxonomies(
         """)
 
 
-def _sync_mentions(tx: Any, mentions: List[Dict[str, Any]], concept_label: str) -> None:
-    """Connects Item to mentioned concept nodes."""
+def _link_topics_batched(session: Any, concept_label: str) -> None:
+    """
+    Writes Topic -> Topic IS_LINKED_TO through apoc.periodic.iterate (parallel sync).
+
+    Same aggregation as _sync_taxonomies, with the MERGEs committed in batches.
+    The inner transactions only see committed data, so GROUPED_BY and
+    RELATES_TO must already be committed. Batches run serially: they share
+    Topic nodes and would contend for their locks.
+    """
+    _run_periodic_iterate(
+        session,
+        f"""
+            MATCH (t1:Topic)<-[:GROUPED_BY]-(:{concept_label})-[:RELATES_TO]->(:{concept_label})-[:GROUPED_BY]->(t2:Topic)
+            WHERE t1 <> t2
+            RETURN t1, t2, count(*) AS strength
+        """,
+        "MERGE (t1)-[r:IS_LINKED_TO]->(t2) SET r.strength = strength, r.last_updated = timestamp()",
+        _SYNC_BATCH_SIZE,
+    )
+
+
+def _build_taxonomy_batches(
+    concepts: List[Dict[str, Any]],
+    graph_fields: List[str]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Explodes concept taxonomy values into flat {concept, val} rows per field.
+
+    One pass over the concepts serves every field, and each query receives only
+    the pairs of its own field instead of the whole concept list.
+    """
+    batches: Dict[str, List[Dict[str, Any]]] = {field_name: [] for field_name in graph_fields}
+    for row in concepts:
+        props = row.get("props", {})
+        relations = row.get("relations", {})
+        if not isinstance(props, dict) or not isinstance(relations, dict):
+            continue
+
+        concept_name = props.get("name")
+        if concept_name is None:
+            continue
+
+        for field_name, pair_rows in batches.items():
+            raw_vals = relations.get(field_name)
+            if raw_vals is None:
+                continue
+            vals = raw_vals if isinstance(raw_vals, list) else [raw_vals]
+            pair_rows.extend({"concept": concept_name, "val": v} for v in vals if v is not None)
+    return batches
+
+
+def _taxonomy_pair_rows(concepts: List[Dict[str, Any]], left: str, right: str) -> List[Dict[str, Any]]:
+    """
+    Flattens the left x right taxonomy values of every concept into distinct pairs.
+
+    Many concepts share the same topic/aspect combination, so the cross product is
+    deduplicated client-side and each MERGE is sent once.
+    """
+    pairs: Dict[tuple, None] = {}  # insertion-ordered set
+    for row in concepts:
+        relations = row.get("relations", {})
+        if not isinstance(relations, dict):
+            continue
+        left_raw = relations.get(left)
+        right_raw = relations.get(right)
+        if left_raw is None or right_raw is None:
+            continue
+        left_vals = [v for v in (left_raw if isinstance(left_raw, list) else [left_raw]) if v is not None]
+        right_vals = [v for v in (right_raw if isinstance(right_raw, list) else [right_raw]) if v is not None]
+        for left_val in left_vals:
+            for right_val in right_vals:
+                pairs[(left_val, right_val)] = None
+    return [{left: left_val, right: right_val} for left_val, right_val in pairs]
+
+
+def _sync_mentions(
+    tx: Any,
+    mentions: List[Dict[str, Any]],
+    concept_label: str,
+    columnar: bool = False
+) -> None:
+    """Connects Item to mentioned concept nodes (columnar: see _sync_from_source)."""
     if not mentions:
         return
-    tx.run(f"""
+    if columnar:
+        _run_batched_columns(tx, f"""
+            UNWIND range(0, size($item_id) - 1) AS idx
+            WITH $item_id[idx] AS item_id, $concept[idx] AS concept, $mention_order[idx] AS mention_order
+            MATCH (i:Item {{item_id: item_id}})
+            MATCH (c:{concept_label} {{name: concept}})
+            MERGE (i)-[:MENTIONS {{mention_order: mention_order}}]->(c)
+        """, mentions, ("item_id", "concept", "mention_order"))
+        return
+    _run_batched(tx, f"""
         UNWIND $rows AS row
         MATCH (i:Item {{item_id: row.item_id}})
         MATCH (c:{concept_label} {{name: row.concept}})
         MERGE (i)-[:MENTIONS {{mention_order: row.mention_order}}]->(c)
-    """, rows=mentions)
+    """, mentions)
 
 
 def _sync_concepts(tx: Any, chains: List[Dict[str, Any]], concepts: List[Dict[str, Any]], concept_label: str) -> None:
@@ -1132,32 +1850,43 @@ def _sync_concepts(tx: Any, chains: List[Dict[str, Any]], concepts: List[Dict[st
     edge attributes (only for templates with CHAIN field).
     """
     # First: create concept nodes from ontology
+    concept_rows: List[Dict[str, Any]] = []
     if concepts:
-        concept_rows: List[Dict[str, Any]] = []
         for row in concepts:
             props = row.get("props", {})
             if isinstance(props, dict) and props.get("name"):
                 concept_rows.append(props)
 
-        tx.run(f"""
+        _run_batched(tx, f"""
             UNWIND $rows AS row
             MERGE (c:{concept_label} {{name: row.name}})
             SET c = row
-        """, rows=concept_rows)
+        """, concept_rows)
 
     # If there are no chains, nothing more to do
     if not chains:
         return
 
-    # Second: create concept nodes from chains that don't exist in ontology
-    tx.run(f"""
-        UNWIND $rows AS row
-        MERGE (s:{concept_label} {{name: row.source}})
-        MERGE (t:{concept_label} {{name: row.target}})
-    """, rows=chains)
+    # Second: create concept nodes from chains that don't exist in ontology.
+    # Endpoints repeat across many chains: dedup in Python and MERGE each name once.
+    ontology_names = {props["name"] for props in concept_rows}
+    missing_names = dict.fromkeys(
+        name
+        for chain in chains
+        for name in (chain["source"], chain["target"])
+        if name not in ontology_names
+    )
+    if missing_names:
+        _run_batched(tx, f"""
+            UNWIND $rows AS row
+            MERGE (c:{concept_label} {{name: row.name}})
+        """, [{"name": name} for name in missing_names])
 
-    # Third: create RELATES_TO relations with attributes
-    tx.run(f"""
+    # Third: create RELATES_TO relations with attributes.
+    # MERGE keys on (source, target) and the last SET wins, so only the last row
+    # of each pair is sent: same final edges, no redundant rows over the wire.
+    relation_rows = list({(chain["source"], chain["target"]): chain for chain in chains}.values())
+    _run_batched(tx, f"""
         UNWIND $rows AS row
         MATCH (s:{concept_label} {{name: row.source}})
         MATCH (t:{concept_label} {{name: row.target}})
@@ -1165,21 +1894,40 @@ def _sync_concepts(tx: Any, chains: List[Dict[str, Any]], concepts: List[Dict[st
         SET r.type = row.type,
             r.description = row.description,
             r.item_id = row.item_id
-    """, rows=chains)
+    """, relation_rows)
 
 
 # ============================================================================
 # GRAPH METRICS
 # ============================================================================
-def _is_gds_available(session: Any) -> bool:
-    """Checks if the GDS plugin is installed."""
+def _supports_count_subqueries(session: Any, driver: Any = None) -> bool:
+    """Checks if the server evaluates COUNT {} subqueries (Neo4j 5.3+, probed once per driver, if given)."""
+    cached = _get_cached_probe(driver, "count_subqueries")
+    if cached is not None:
+        return cached
+    try:
+        session.run("RETURN COUNT { RETURN 1 } AS n").single()
+        supported = True
+    except Exception:
+        supported = False
+    _set_cached_probe(driver, "count_subqueries", supported)
+    return supported
+
+
+def _is_gds_available(session: Any, driver: Any = None) -> bool:
+    """Checks if the GDS plugin is installed (probed once per driver, if given)."""
+    cached = _get_cached_probe(driver, "gds")
+    if cached is not None:
+        return cached
     try:
         result = session.run("RETURN gds.version() AS version")
         version = result.single()["version"]
         logger.info(f"GDS detectado: versão {version}")
-        return True
+        available = True
     except Exception:
-        return False
+        available = False
+    _set_cached_probe(driver, "gds", available)
+    return available
 
 
 def _get_graph_strategy(payload: GraphPayload) -> str:
@@ -1202,25 +1950,34 @@ def _get_graph_strategy(payload: GraphPayload) -> str:
 def compute_metrics(
     session: Any,
     payload: GraphPayload,
-    reporter: TaskReporter
+    reporter: TaskReporter,
+    driver: Any = None,
+    database: Optional[str] = None,
+    workers: int = 1
 ) -> None:
     """
     Calculates Neo4j graph metrics: native (Cypher) and advanced (GDS).
 
     Native metrics are always calculated.
-    GDS metrics are calculated if the plugin is available.
+    GDS metrics are calculated if the plugin is available; with workers > 1
+    and a driver, the GDS algorithms run on concurrent sessions.
     """
     concept_label = payload.concept_label
     graph_fields = payload.graph_fields
+    apoc_available = _is_apoc_available(session, driver)
+    count_subqueries = _supports_count_subqueries(session, driver)
 
     # 1. Native metrics (always run)
     with reporter.step("Calculating Native Metrics"):
-        _compute_native_concept_metrics(session, concept_label)
-        _compute_native_taxonomy_metrics(session, concept_label, graph_fields)
-        _compute_native_source_metrics(session, concept_label)
+        _compute_native_concept_metrics(session, concept_label, single_pass=count_subqueries)
+        _compute_native_taxonomy_metrics(
+            session, concept_label, graph_fields,
+            apoc_available=apoc_available, count_subqueries=count_subqueries,
+        )
+        _compute_native_source_metrics(session, concept_label, count_subqueries=count_subqueries)
 
     # 2. GDS metrics (optional with fallback)
-    if not _is_gds_available(session):
+    if not _is_gds_available(session, driver):
         reporter.warning(
             "GDS not installed. Install the Graph Data Science plugin for "
             "advanced metrics (PageRank, Betweenness, Communities)."
@@ -1232,7 +1989,10 @@ def compute_metrics(
 
     with reporter.step("Calculating GDS Metrics"):
         try:
-            _compute_gds_metrics(session, payload, strategy, reporter)
+            _compute_gds_metrics(
+                session, payload, strategy, reporter,
+                driver=driver, database=database, workers=workers,
+            )
         except Exception as e:
             reporter.warning(f"Error calculating GDS metrics: {e}")
 
@@ -1269,7 +2029,7 @@ def compute_metrics_graphqlite(
 # ----------------------------------------------------------------------------
 # NATIVE METRICS (Pure Cypher - always available)
 # ----------------------------------------------------------------------------
-def _compute_native_concept_metrics(session: Any, concept_label: str) -> None:
+def _compute_native_concept_metrics(session: Any, concept_label: str, single_pass: bool = False) -> None:
     """
     Calculates native metrics for concept nodes.
 
@@ -1279,10 +2039,36 @@ def _compute_native_concept_metrics(session: Any, concept_label: str) -> None:
     - out_degree: outgoing relations
     - mention_count: Items that mention the concept
     - source_count: distinct Sources where it appears
+
+    With single_pass=True (Neo4j 5.3+) all five are computed in one scan of the concept
+    nodes, each count in its own COUNT {} subquery (no out x in or mentions x
+    sources row product), and written with a single SET; GraphQLite keeps the
+    two-query form.
     """
     if not validate_cypher_label(concept_label):
         return
 
+    if single_pass:
+        # RELATES_TO is MERGEd once per pair; an Item may MENTION a concept more
+        # than once (one edge per mention_order), hence the DISTINCT counts.
+        session.run(f"""
+            MATCH (c:{concept_label})
+            WITH c,
+                 COUNT {{ (c)-[:RELATES_TO]->() }} AS out_deg,
+                 COUNT {{ (c)<-[:RELATES_TO]-() }} AS in_deg,
+                 COUNT {{ MATCH (c)<-[:MENTIONS]-(i:Item) RETURN DISTINCT i }} AS mentions,
+                 COUNT {{
+                     MATCH (c)<-[:MENTIONS]-(:Item)-[:FROM_SOURCE]->(s:Source)
+                     RETURN DISTINCT s
+                 }} AS sources
+            SET c.out_degree = out_deg,
+                c.in_degree = in_deg,
+                c.degree = out_deg + in_deg,
+                c.mention_count = mentions,
+                c.source_count = sources
+        """)
+        return
+
     # Degree centrality (based on RELATES_TO)
     session.run(f"""
         MATCH (c:{concept_label})
@@ -1308,7 +2094,9 @@ def _compute_native_concept_metrics(session: Any, concept_label: str) -> None:
 def _compute_native_taxonomy_metrics(
     session: Any,
     concept_label: str,
-    graph_fields: List[str]
+    graph_fields: List[str],
+    apoc_available: bool = False,
+    count_subqueries: bool = False
 ) -> None:
     """
     Calculates native metrics for taxonomy nodes (Topic, Aspect, Dimension, etc).
@@ -1318,23 +2106,32 @@ def _compute_native_taxonomy_metrics(
     - weighted_degree: sum of IS_LINKED_TO strengths (if exists)
     - aspect_diversity: distinct aspects (if Topic)
     - dimension_diversity: distinct dimensions (if Topic)
+
+    With APOC installed the per-field concept counts go out in one round trip.
+    With count_subqueries=True (Neo4j 5.3+) the Topic diversities use COUNT {}
+    subqueries instead of aggregating concept x aspect/dimension rows.
     """
     if not validate_cypher_label(concept_label):
         return
 
-    for field_name in graph_fields:
-        label = sanitize_cypher_label(field_name.capitalize())
-        rel_type = _get_taxonomy_relation(field_name)
-
-        if not validate_cypher_label(label) or not validate_cypher_label(rel_type):
-            continue
-
-        # Concept count
-        session.run(f"""
+    # Concept count
+    count_statements = [
+        f"""
             MATCH (t:{label})<-[:{rel_type}]-(c:{concept_label})
             WITH t, count(c) AS cnt
             SET t.concept_count = cnt
-        """)
+        """
+        for _field_name, label, rel_type in _taxonomy_specs(tuple(graph_fields))
+    ]
+    if apoc_available and len(count_statements) > 1:
+        session.run(
+            "UNWIND $statements AS statement "
+            "CALL apoc.cypher.doIt(statement, {}) YIELD value RETURN count(*)",
+            statements=count_statements,
+        ).consume()
+    else:
+        for statement in count_statements:
+            session.run(statement)
 
     # Topic-specific metrics (if exists)
     if "topic" in graph_fields:
@@ -1346,6 +2143,10 @@ def _compute_native_taxonomy_metrics(
             SET t.weighted_degree = wd
         """)
 
+        if count_subqueries:
+            _compute_topic_diversity(session, concept_label, graph_fields)
+            return
+
         # Aspect diversity (if aspect exists)
         if "aspect" in graph_fields:
             session.run(f"""
@@ -1365,17 +2166,55 @@ def _compute_native_taxonomy_metrics(
             """)
 
 
-def _compute_native_source_metrics(session: Any, concept_label: str) -> None:
+def _compute_topic_diversity(session: Any, concept_label: str, graph_fields: List[str]) -> None:
+    """Sets Topic aspect/dimension diversity with COUNT {} subqueries (Neo4j 5)."""
+    assignments = []
+    if "aspect" in graph_fields:
+        assignments.append(
+            f"t.aspect_diversity = COUNT {{ MATCH (t)<-[:GROUPED_BY]-(:{concept_label})"
+            "-[:QUALIFIED_BY]->(a:Aspect) RETURN DISTINCT a }"
+        )
+    if "dimension" in graph_fields:
+        assignments.append(
+            f"t.dimension_diversity = COUNT {{ MATCH (t)<-[:GROUPED_BY]-(:{concept_label})"
+            "-[:BELONGS_TO]->(d:Dimension) RETURN DISTINCT d }"
+        )
+    if not assignments:
+        return
+
+    # Only Topics with classified concepts, as in the aggregating form
+    session.run(f"""
+        MATCH (t:Topic)
+        WHERE EXISTS {{ (t)<-[:GROUPED_BY]-(:{concept_label}) }}
+        SET {", ".join(assignments)}
+    """)
+
+
+def _compute_native_source_metrics(session: Any, concept_label: str, count_subqueries: bool = False) -> None:
     """
     Calculates native metrics for Source nodes.
 
     Metrics:
     - item_count: Items extracted from the source
     - concept_count: mentioned concepts
+
+    With count_subqueries=True (Neo4j 5.3+) both counts are COUNT {} subqueries,
+    avoiding the items x mentions row product.
     """
     if not validate_cypher_label(concept_label):
         return
 
+    if count_subqueries:
+        session.run(f"""
+            MATCH (s:Source)
+            SET s.item_count = COUNT {{ (s)<-[:FROM_SOURCE]-(:Item) }},
+                s.concept_count = COUNT {{
+                    MATCH (s)<-[:FROM_SOURCE]-(:Item)-[:MENTIONS]->(c:{concept_label})
+                    RETURN DISTINCT c
+                }}
+        """)
+        return
+
     session.run(f"""
         MATCH (s:Source)
         OPTIONAL MATCH (s)<-[:FROM_SOURCE]-(i:Item)
@@ -1393,7 +2232,10 @@ def _compute_gds_metrics(
     session: Any,
     payload: GraphPayload,
     strategy: str,
-    reporter: TaskReporter
+    reporter: TaskReporter,
+    driver: Any = None,
+    database: Optional[str] = None,
+    workers: int = 1
 ) -> None:
     """
     Calculates GDS metrics (PageRank, Betweenness, Louvain).
@@ -1402,8 +2244,10 @@ def _compute_gds_metrics(
     - RELATES_TO: uses explicit relation
     - CO_TAXONOMY: uses weighted co-taxonomy
     - CO_CITATION: uses co-citation via Source
+
+    The algorithms share no state besides the read-only projection, so with
+    workers > 1 and a driver each one runs on its own session.
     """
-    concept_label = payload.concept_label
     graph_name = "synesis_metrics_graph"
 
     # Clear previous projection if exists
@@ -1420,25 +2264,34 @@ def _compute_gds_metrics(
 
     reporter.info(f"GDS projection: {node_count} nodes, {rel_count} relationships")
 
-    # Calculate metrics
-    try:
-        _run_pagerank(session, graph_name, concept_label)
-        reporter.success("PageRank calculated")
-    except Exception as e:
-        reporter.warning(f"PageRank failed: {e}")
-
-    try:
-        # Betweenness can be slow on large graphs
-        _run_betweenness(session, graph_name, concept_label)
-        reporter.success("Betweenness calculated")
-    except Exception as e:
-        reporter.warning(f"Betweenness failed: {e}")
+    # Calculate metrics (Betweenness can be slow on large graphs)
+    algorithms = [
+        ("PageRank", "PageRank calculated", _run_pagerank),
+        ("Betweenness", "Betweenness calculated", _run_betweenness),
+        ("Louvain", "Communities (Louvain) calculated", _run_louvain),
+    ]
 
-    try:
-        _run_louvain(session, graph_name, concept_label)
-        reporter.success("Communities (Louvain) calculated")
-    except Exception as e:
-        reporter.warning(f"Louvain failed: {e}")
+    if driver is not None and workers > 1:
+        def run_algorithm(runner: Any) -> None:
+            with driver.session(database=database) as algorithm_session:
+                runner(algorithm_session, graph_name)
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(algorithms))) as executor:
+            futures = [executor.submit(run_algorithm, runner) for _, _, runner in algorithms]
+            # Report from this thread, in the usual order
+            for (name, done, _), future in zip(algorithms, futures):
+                try:
+                    future.result()
+                    reporter.success(done)
+                except Exception as e:
+                    reporter.warning(f"{name} failed: {e}")
+    else:
+        for name, done, runner in algorithms:
+            try:
+                runner(session, graph_name)
+                reporter.success(done)
+            except Exception as e:
+                reporter.warning(f"{name} failed: {e}")
 
     # Clear projection
     _drop_gds_graph(session, graph_name)
@@ -1485,11 +2338,7 @@ def _create_gds_projection(
     elif strategy == "CO_TAXONOMY":
         # Projection via weighted co-taxonomy using aggregation function
         # Build taxonomy relations list dynamically
-        taxonomy_rels = []
-        for field_name in payload.graph_fields:
-            rel_type = _get_taxonomy_relation(field_name)
-            if validate_cypher_label(rel_type):
-                taxonomy_rels.append(rel_type)
+        taxonomy_rels = [rel_type for _, _, rel_type in _taxonomy_specs(tuple(payload.graph_fields))]
 
         if not taxonomy_rels:
             return (0, 0)
@@ -1530,37 +2379,34 @@ def _create_gds_projection(
     return (record["nodeCount"], record["relationshipCount"])
 
 
-def _run_pagerank(session: Any, graph_name: str, concept_label: str) -> None:
+def _run_pagerank(session: Any, graph_name: str) -> None:
     """Executes PageRank and persists in nodes."""
-    session.run(f"""
-        CALL gds.pageRank.stream('{graph_name}')
-        YIELD nodeId, score
-        WITH gds.util.asNode(nodeId) AS node, score
-        WHERE '{concept_label}' IN labels(node)
-        SET node.pagerank = score
-    """)
+    _run_gds_write(session, "gds.pageRank.write", graph_name, "pagerank")
 
 
-def _run_betweenness(session: Any, graph_name: str, concept_label: str) -> None:
+def _run_betweenness(session: Any, graph_name: str) -> None:
     """Executes Betweenness Centrality and persists in nodes."""
-    session.run(f"""
-        CALL gds.betweenness.stream('{graph_name}')
-        YIELD nodeId, score
-        WITH gds.util.asNode(nodeId) AS node, score
-        WHERE '{concept_label}' IN labels(node)
-        SET node.betweenness = score
-    """)
+    _run_gds_write(session, "gds.betweenness.write", graph_name, "betweenness")
 
 
-def _run_louvain(session: Any, graph_name: str, concept_label: str) -> None:
+def _run_louvain(session: Any, graph_name: str) -> None:
     """Executes Louvain (community detection) and persists in nodes."""
-    session.run(f"""
-        CALL gds.louvain.stream('{graph_name}')
-        YIELD nodeId, communityId
-        WITH gds.util.asNode(nodeId) AS node, communityId
-        WHERE '{concept_label}' IN labels(node)
-        SET node.community = communityId
-    """)
+    _run_gds_write(session, "gds.louvain.write", graph_name, "community")
+
+
+def _run_gds_write(session: Any, procedure: str, graph_name: str, write_property: str) -> None:
+    """
+    Runs a GDS algorithm in write mode, persisting results server-side.
+
+    Every projection strategy holds only concept nodes, so no per-row
+    gds.util.asNode lookup and label filter (stream mode) is needed.
+    """
+    session.run(
+        f"CALL {procedure}($graph_name, {{writeProperty: $write_property}}) "
+        "YIELD nodePropertiesWritten RETURN nodePropertiesWritten",
+        graph_name=graph_name,
+        write_property=write_property,
+    ).consume()
 
 
 # ============================================================================
@@ -1573,6 +2419,9 @@ class Neo4jConfig:
     user: str
     password: str
     database: str = "neo4j"
+    sync_workers: int = 1  # >1: parallel sessions, one transaction per step
+    max_connection_pool_size: int = 100
+    connection_acquisition_timeout: float = 60.0  # seconds
 
 
 @dataclass
@@ -1609,7 +2458,10 @@ def _load_neo4j_config(parsed_cfg: Dict[str, Any]) -> Union[Neo4jConfig, Connect
             uri=uri,
             user=cfg["user"],
             password=cfg["password"],
-            database=cfg.get("database", "neo4j")
+            database=cfg.get("database", "neo4j"),
+            sync_workers=max(1, int(cfg.get("sync_workers", 1))),
+            max_connection_pool_size=max(1, int(cfg.get("max_connection_pool_size", 100))),
+            connection_acquisition_timeout=float(cfg.get("connection_acquisition_timeout", 60.0)),
         )
     except KeyError as e:
         return ConnectionError(
@@ -1737,6 +2589,40 @@ def _resolve_graphqlite_db_path(raw_db_path: str, config_path: Path, project_pat
 # ============================================================================
 # DATABASE CREATION
 # ============================================================================
+# Databases already confirmed (or created) per driver, so repeated runs in one
+# process skip the SHOW DATABASES round-trip to the system database.
+_KNOWN_DATABASES: "weakref.WeakKeyDictionary[Any, Set[str]]" = weakref.WeakKeyDictionary()
+
+
+def _is_known_database(driver: Any, database_name: str) -> bool:
+    """Returns True if database_name was already confirmed through this driver."""
+    try:
+        return database_name in _KNOWN_DATABASES.get(driver, ())
+    except TypeError:  # not weak-referenceable
+        return False
+
+
+def _remember_database(driver: Any, database_name: str) -> None:
+    """Records that database_name exists on the driver's server."""
+    try:
+        _KNOWN_DATABASES.setdefault(driver, set()).add(database_name)
+    except TypeError:  # not weak-referenceable
+        pass
+
+
+def _run_system_query(driver: Any, query: str, **params: Any) -> List[Any]:
+    """
+    Runs a read query against the system database and returns its records.
+
+    Uses driver.execute_query (neo4j >= 5.5) when available, otherwise a
+    read session on the system database.
+    """
+    if hasattr(driver, "execute_query"):
+        return driver.execute_query(query, params, database_="system", routing_="r").records
+    with driver.session(database="system", default_access_mode="READ") as session:
+        return list(session.run(query, **params))
+
+
 def ensure_database_exists(driver: Any, database_name: str, reporter: TaskReporter) -> Optional[SyncError]:
     """
     Creates the database if it doesn't exist.
@@ -1746,20 +2632,27 @@ def ensure_database_exists(driver: Any, database_name: str, reporter: TaskReport
     """
     safe_name = sanitize_database_name(database_name)
 
+    if _is_known_database(driver, safe_name):
+        reporter.info(f"Database already exists: {safe_name}")
+        return None
+
     try:
-        with driver.session(database="system") as session:
-            # Check if database exists
-            result = session.run("SHOW DATABASES")
-            existing = {record["name"] for record in result}
-
-            if safe_name not in existing:
-                reporter.info(f"Creating database: {safe_name}")
-                session.run(f"CREATE DATABASE `{safe_name}` IF NOT EXISTS")
-                # Wait for database to become available
-                import time as _time
-                _time.sleep(2)
-            else:
-                reporter.info(f"Database already exists: {safe_name}")
+        # Check if database exists (filtered server-side, routed as a read)
+        exists = _run_system_query(
+            driver,
+            "SHOW DATABASES YIELD name WHERE name = $name RETURN count(*) > 0 AS exists",
+            name=safe_name,
+        )[0]["exists"]
+
+        if not exists:
+            reporter.info(f"Creating database: {safe_name}")
+            with driver.session(database="system") as session:
+                session.run(f"CREATE DATABASE `{safe_name}` IF NOT EXISTS").consume()
+            # Wait for database to become available
+            _wait_for_database_online(driver, safe_name)
+        else:
+            reporter.info(f"Database already exists: {safe_name}")
+        _remember_database(driver, safe_name)
         return None
     except Exception as e:
         # If fails (e.g.: Community Edition), try using default database
@@ -1774,6 +2667,26 @@ def ensure_database_exists(driver: Any, database_name: str, reporter: TaskReport
         )
 
 
+# Polling of a newly created database until it reports "online"
+_DATABASE_ONLINE_TIMEOUT_S = 30.0
+_DATABASE_ONLINE_POLL_S = 0.1
+
+
+def _wait_for_database_online(driver: Any, database_name: str) -> None:
+    """Polls the system database until database_name is online (or the timeout expires)."""
+    deadline = time.monotonic() + _DATABASE_ONLINE_TIMEOUT_S
+    while True:
+        statuses = _run_system_query(
+            driver,
+            "SHOW DATABASES YIELD name, currentStatus WHERE name = $name "
+            "RETURN collect(currentStatus) AS statuses",
+            name=database_name,
+        )[0]["statuses"]
+        if "online" in statuses or time.monotonic() >= deadline:
+            return
+        time.sleep(_DATABASE_ONLINE_POLL_S)
+
+
 def get_database_name_from_project(json_data: Dict[str, Any]) -> str:
     """Extracts project name to use as database name."""
     project_name = json_data.get("project", {}).get("name", "synesis")
@@ -1829,6 +2742,52 @@ class BackendAdapter(ABC):
         raise NotImplementedError
 
 
+# Drivers shared by the pipeline runs of a process, one per (uri, user), stored
+# with the remaining settings they were built with. A driver owns the connection
+# pool (and the plugin probe cache), so reusing it skips handshake and routing
+# discovery on repeated run_pipeline calls.
+_NEO4J_DRIVERS: Dict[tuple, tuple] = {}
+
+
+def _close_neo4j_driver(driver: Any) -> None:
+    try:
+        driver.close()
+    except Exception as e:
+        logger.debug(f"Error closing Neo4j driver: {e}")
+
+
+def _get_shared_neo4j_driver(driver_factory: Any, config: "Neo4jConfig") -> Any:
+    """
+    Returns the process-wide driver for the config's connection, creating it on first use.
+
+    A driver built with other credentials or pool settings for the same
+    (uri, user) is closed and replaced.
+    """
+    key = (config.uri, config.user)
+    settings = (config.password, config.max_connection_pool_size, config.connection_acquisition_timeout)
+    entry = _NEO4J_DRIVERS.get(key)
+    if entry is not None:
+        if entry[0] == settings:
+            return entry[1]
+        _close_neo4j_driver(_NEO4J_DRIVERS.pop(key)[1])
+    driver = driver_factory.driver(
+        config.uri,
+        auth=(config.user, config.password),
+        max_connection_pool_size=config.max_connection_pool_size,
+        connection_acquisition_timeout=config.connection_acquisition_timeout,
+    )
+    _NEO4J_DRIVERS[key] = (settings, driver)
+    return driver
+
+
+@atexit.register
+def _close_shared_neo4j_drivers() -> None:
+    """Closes every shared driver (at interpreter exit)."""
+    while _NEO4J_DRIVERS:
+        _, (_, driver) = _NEO4J_DRIVERS.popitem()
+        _close_neo4j_driver(driver)
+
+
 class Neo4jBackendAdapter(BackendAdapter):
     """Neo4j backend implementation bound to the BackendAdapter contract."""
 
@@ -1856,10 +2815,7 @@ class Neo4jBackendAdapter(BackendAdapter):
 
         try:
             reporter.info(f"[{self.backend_name}] Connecting to {self.config.uri}")
-            self.driver = driver_factory.driver(
-                self.config.uri,
-                auth=(self.config.user, self.config.password),
-            )
+            self.driver = _get_shared_neo4j_driver(driver_factory, self.config)
             return None
         except Exception as e:
             return ConnectionError(
@@ -1904,8 +2860,16 @@ class Neo4jBackendAdapter(BackendAdapter):
                 stage="connection",
             )
 
-        with reporter.step("Synchronizing Graph (Transactional)"):
-            sync_error = sync_to_neo4j(self.session, payload)
+        workers = self.config.sync_workers
+        mode = "Transactional" if workers == 1 else f"{workers} parallel sessions, non-atomic"
+        with reporter.step(f"Synchronizing Graph ({mode})"):
+            sync_error = sync_to_neo4j(
+                self.session,
+                payload,
+                driver=self.driver,
+                database=self.db_name,
+                workers=workers,
+            )
             if sync_error:
                 return sync_error
         return None
@@ -1917,7 +2881,14 @@ class Neo4jBackendAdapter(BackendAdapter):
                 stage="connection",
             )
         try:
-            compute_metrics(self.session, payload, reporter)
+            compute_metrics(
+                self.session,
+                payload,
+                reporter,
+                driver=self.driver,
+                database=self.db_name,
+                workers=self.config.sync_workers,
+            )
             return None
         except Exception as e:
             return SyncError(
@@ -1930,9 +2901,8 @@ class Neo4jBackendAdapter(BackendAdapter):
         if self.session is not None:
             self.session.close()
             self.session = None
-        if self.driver is not None:
-            self.driver.close()
-            self.driver = None
+        # The driver is shared across runs and closed at exit
+        self.driver = None
 
 
 class GraphQLiteBackendAdapter(BackendAdapter):
@@ -2067,7 +3037,7 @@ _HTML_RELATION_COLORS: Dict[str, str] = {
 
 
 def _html_relation_color(relation: str) -> str:
-    norm = relation.upper().replace("-", "_").replace(" ", "_")
+    norm = relation.translate(_RELATION_TYPE_TRANS).upper()
     if norm in _HTML_RELATION_COLORS:
         return _HTML_RELATION_COLORS[norm]
     return _HTML_PALETTE[abs(hash(norm)) % len(_HTML_PALETTE)]
@@ -2731,6 +3701,7 @@ def run_pipeline(
     backend: str = BACKEND_NEO4J,
     html_options: Optional[Dict[str, Any]] = None,
     json_path: Optional[Path] = None,
+    use_cache: bool = False,
 ) -> PipelineResult:
     """
     Executes complete pipeline: compilation → connection → synchronization.
@@ -2741,6 +3712,7 @@ def run_pipeline(
         reporter: Reporter for visual feedback
         html_options: Optional CLI overrides for the HTML backend (keys match HTMLConfig fields)
         json_path: Path to pre-compiled Synesis JSON export (alternative to project_path)
+        use_cache: Reuse the compiled payload of an unchanged project (default_cache_dir())
 
     Returns:
         PipelineResult indicating success or typed error.
@@ -2815,7 +3787,8 @@ def run_pipeline(
         load_fn = lambda: load_json_project(json_path, reporter)
     else:
         step_label = "Compiling Project (In-Memory)"
-        load_fn = lambda: compile_project(project_path, reporter)
+        cache_dir = default_cache_dir() if use_cache else None
+        load_fn = lambda: compile_project(project_path, reporter, cache_dir=cache_dir)
 
     with reporter.step(step_label):
         compile_result = load_fn()
@@ -2985,7 +3958,7 @@ def _validate_source(project, json_input) -> None:
         raise click.UsageError("--project and --json are mutually exclusive.")
 
 
-def _run_and_exit(backend: str, project, json_input, config, html_options=None) -> None:
+def _run_and_exit(backend: str, project, json_input, config, html_options=None, cache=False) -> None:
     reporter = TaskReporter(f"Synesis → {backend}")
     result = run_pipeline(
         project_path=Path(project).resolve() if project else None,
@@ -2994,6 +3967,7 @@ def _run_and_exit(backend: str, project, json_input, config, html_options=None)
         reporter=reporter,
         backend=backend,
         html_options=html_options,
+        use_cache=cache,
     )
     reporter.print_summary()
     sys.exit(0 if result.success else 1)
@@ -3001,6 +3975,8 @@ def _run_and_exit(backend: str, project, json_input, config, html_options=None)
 
 # Shared decorators
 def _source_options(fn):
+    fn = click.option("--cache", is_flag=True, default=False,
+                      help="Reuse the compiled payload when the project is unchanged.")(fn)
     fn = click.option("--json", "json_input", default=None, metavar="PATH",
                       help="Path to a Synesis v3.0 JSON export (alternative to --project).")(fn)
     fn = click.option("--project", default=None, metavar="PATH",
@@ -3044,18 +4020,18 @@ if _CLICK_AVAILABLE:
     @_config_option
     @click.option("--database", default=None,
                   help="Neo4j database name (overrides config).")
-    def cmd_neo4j(project, json_input, config, database):
+    def cmd_neo4j(project, json_input, cache, config, database):
         """Sync a Synesis project to a Neo4j database."""
         _validate_source(project, json_input)
-        _run_and_exit(BACKEND_NEO4J, project, json_input, config)
+        _run_and_exit(BACKEND_NEO4J, project, json_input, config, cache=cache)
 
     @main.command(cls=_SynesisCommand, name="graphqlite", epilog=_EPILOG_GRAPHQLITE)
     @_source_options
     @_config_option
-    def cmd_graphqlite(project, json_input, config):
+    def cmd_graphqlite(project, json_input, cache, config):
         """Sync a Synesis project to a GraphQLite SQLite file."""
         _validate_source(project, json_input)
-        _run_and_exit(BACKEND_GRAPHQLITE, project, json_input, config)
+        _run_and_exit(BACKEND_GRAPHQLITE, project, json_input, config, cache=cache)
 
     @main.command(cls=_SynesisCommand, name="html", epilog=_EPILOG_HTML)
     @_source_options
@@ -3076,7 +4052,7 @@ if _CLICK_AVAILABLE:
                   help="Include concepts with no chain connections.")
     @click.option("--all", "html_all", is_flag=True, default=False,
                   help="Disable all filters (show every concept).")
-    def cmd_html(project, json_input, config, html_output, group_by, min_frequency,
+    def cmd_html(project, json_input, cache, config, html_output, group_by, min_frequency,
                  min_source_count, max_nodes, max_hyperedges, include_isolated, html_all):
         """Render an interactive HTML graph visualization from a Synesis project."""
         _validate_source(project, json_input)
@@ -3099,7 +4075,7 @@ if _CLICK_AVAILABLE:
                 html_options["max_hyperedges"] = max_hyperedges
             if include_isolated:
                 html_options["include_isolated"] = True
-        _run_and_exit(BACKEND_HTML, project, json_input, config, html_options)
+        _run_and_exit(BACKEND_HTML, project, json_input, config, html_options, cache=cache)
 
 else:
     # Fallback: argparse when click is not installed
@@ -3113,6 +4089,7 @@ else:
         src = parser.add_mutually_exclusive_group(required=True)
         src.add_argument("--project", default=None)
         src.add_argument("--json", default=None, dest="json_input")
+        parser.add_argument("--cache", action="store_true", default=False)
         parser.add_argument("--config", default="config.toml")
         parser.add_argument("--backend", choices=SUPPORTED_BACKENDS, default=BACKEND_NEO4J)
         parser.add_argument("--html-output", default=None)
@@ -3153,6 +4130,7 @@ else:
             json_path=Path(args.json_input).resolve() if args.json_input else None,
             config_path=Path(args.config).resolve(),
             reporter=reporter, backend=args.backend, html_options=html_options,
+            use_cache=args.cache,
         )
         reporter.print_summary()
         return 0 if result.success else 1
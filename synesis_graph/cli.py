@@ -172,6 +172,10 @@ _EPILOG_HTML = _ex(
 # ---------------------------------------------------------------------------
 
 def _source_options(fn):
+    fn = click.option(
+        "--cache", is_flag=True, default=False,
+        help="Reuse the compiled payload when the project is unchanged."
+    )(fn)
     fn = click.option(
         "--json", "json_input", default=None, type=click.Path(path_type=Path),
         help="Path to a Synesis v3.0 JSON export (alternative to --project)."
@@ -217,7 +221,7 @@ def main(ctx) -> None:
 @_source_options
 @_config_option
 @click.option("--database", default=None, help="Neo4j database name (overrides config).")
-def neo4j(project, json_input, config, database):
+def neo4j(project, json_input, cache, config, database):
     """Sync a Synesis project to a Neo4j database."""
     _validate_source(project, json_input)
     from synesis2graph import run_pipeline, TaskReporter
@@ -234,6 +238,7 @@ def neo4j(project, json_input, config, database):
         reporter=reporter,
         backend=BACKEND_NEO4J,
         html_options=html_options,
+        use_cache=cache,
     )
     _report_result(reporter, result)
 
@@ -245,7 +250,7 @@ def neo4j(project, json_input, config, database):
 @main.command(cls=_SynesisCommand, epilog=_EPILOG_GRAPHQLITE)
 @_source_options
 @_config_option
-def graphqlite(project, json_input, config):
+def graphqlite(project, json_input, cache, config):
     """Sync a Synesis project to a GraphQLite SQLite file."""
     _validate_source(project, json_input)
     from synesis2graph import run_pipeline, TaskReporter
@@ -256,6 +261,7 @@ def graphqlite(project, json_input, config):
         config_path=Path(config).resolve(),
         reporter=reporter,
         backend=BACKEND_GRAPHQLITE,
+        use_cache=cache,
     )
     _report_result(reporter, result)
 
@@ -283,7 +289,7 @@ def graphqlite(project, json_input, config):
               help="Include concepts with no chain connections.")
 @click.option("--all", "html_all", is_flag=True, default=False,
               help="Disable all filters (show every concept).")
-def html(project, json_input, config, html_output, group_by, min_frequency,
+def html(project, json_input, cache, config, html_output, group_by, min_frequency,
          min_source_count, max_nodes, max_hyperedges, include_isolated, html_all):
     """Render an interactive HTML graph visualization from a Synesis project."""
     _validate_source(project, json_input)
@@ -317,6 +323,7 @@ def html(project, json_input, config, html_output, group_by, min_frequency,
         reporter=reporter,
         backend=BACKEND_HTML,
         html_options=html_options,
+        use_cache=cache,
     )
     _report_result(reporter, result)
 